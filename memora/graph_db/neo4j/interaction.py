@@ -1,142 +1,344 @@
+import asyncio
+import os
 import uuid
-from datetime import datetime
-from typing import Dict, List, Tuple
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Dict, List, Tuple
 
 import neo4j
+import neo4j.time
 import shortuuid
 from typing_extensions import override
 
 from memora.schema import models
-from memora.schema.storage_schema import MemoriesAndInteraction
+from memora.schema.storage_schema import MemoriesAndInteraction, MemoryToStore
 
 from ..base import BaseGraphDB
+from .runtime import execute_read_in_parallel_runtime
+
+_Q_UPDATE_INTERACTION_MESSAGES = """
+    MATCH (interaction: Interaction {org_id: $org_id, user_id: $user_id, interaction_id: $interaction_id})
+    USING INDEX interaction:Interaction(org_id, user_id, interaction_id)
+    WITH interaction, COALESCE(interaction.message_roles, []) AS existingRoles, COALESCE(interaction.message_contents, []) AS existingContents
+
+    // Find the first point of difference, an updated interaction shorter than the existing one differs at its end.
+    WITH interaction, SIZE(existingRoles) AS existingCount, COALESCE(
+        HEAD([idx IN RANGE(0, SIZE(existingRoles) - 1) WHERE
+            idx >= SIZE($message_roles)
+            OR existingRoles[idx] <> $message_roles[idx]
+            OR existingContents[idx] <> $message_contents[idx]
+        ]),
+        SIZE(existingRoles)
+    ) AS truncateFrom
+
+    // Memories from the truncated messages become standalone.
+    CALL (interaction, truncateFrom) {
+        MATCH (interaction)<-[source:MESSAGE_SOURCE]-(:Memory)
+        WHERE source.msg_position >= truncateFrom
+        DELETE source
+    }
+
+    // The existing messages up to that point are the same as the updated ones, so they're replaced in a single SET.
+    SET interaction.message_roles = $message_roles, interaction.message_contents = $message_contents
+
+    RETURN truncateFrom, existingCount - truncateFrom AS truncatedCount, SIZE($message_roles) - truncateFrom AS addedCount
+"""
+
+_Q_ADD_MEMORIES_WITH_THEIR_SOURCE_LINKS = """
+    // Retrieve the interaction, and the users memory collection.
+    MATCH (interaction: Interaction {org_id: $org_id, user_id: $user_id, interaction_id: $interaction_id})
+    USING INDEX interaction:Interaction(org_id, user_id, interaction_id)
+    MATCH (user:User {org_id: $org_id, user_id: $user_id})-[:HAS_MEMORIES]->(mc)
+    USING INDEX user:User(org_id, user_id)
+
+    // Create the memory nodes, with their fields taken from the parallel parameter lists.
+    UNWIND RANGE(0, SIZE($memory_ids) - 1) as idx
+    CREATE (memory:Memory {
+        org_id: $org_id,
+        user_id: $user_id,
+        agent_id: $agent_id,
+        interaction_id: $interaction_id,
+        memory_id: $memory_ids[idx],
+        memory: $memory_texts[idx],
+        obtained_at: $interaction_date
+    })
+
+    // Link to interaction
+    CREATE (interaction)<-[:INTERACTION_SOURCE]-(memory)
+
+    // Link to user's memory collection
+    CREATE (mc)-[:INCLUDES]->(memory)
+
+    // For each memory, Link to it's source message positions in the interaction.
+    WITH interaction, memory, $source_positions[idx] as all_memory_source_msg_pos
+    UNWIND all_memory_source_msg_pos as source_msg_pos
+    CREATE (interaction)<-[:MESSAGE_SOURCE {msg_position: source_msg_pos}]-(memory)
+
+"""
+
+_Q_LINK_CONTRARY_MEMORIES = """
+    UNWIND RANGE(0, SIZE($contrary_memory_ids) - 1) as idx
+    MATCH (new_contrary_memory:Memory {org_id: $org_id, user_id: $user_id, memory_id: $contrary_memory_ids[idx]})
+    USING INDEX new_contrary_memory:Memory(org_id, user_id, memory_id)
+    MATCH (old_memory:Memory {org_id: $org_id, user_id: $user_id, memory_id: $existing_contrary_memory_ids[idx]})
+    USING INDEX old_memory:Memory(org_id, user_id, memory_id)
+
+    MERGE (new_contrary_memory)<-[:CONTRARY_UPDATE]-(old_memory)
+
+"""
+
+_Q_SAVE_INTERACTION_WITH_MEMORIES = """
+    MATCH (u:User {org_id: $org_id, user_id: $user_id})-[:INTERACTIONS_IN]->(ic)
+    USING INDEX u:User(org_id, user_id)
+    MATCH (u)-[:HAS_MEMORIES]->(mc)
+    CREATE (interaction:Interaction {
+        org_id: $org_id,
+        user_id: $user_id,
+        agent_id: $agent_id,
+        interaction_id: $interaction_id,
+        created_at: $interaction_date,
+        updated_at: $interaction_date,
+        message_roles: $message_roles,
+        message_contents: $message_contents
+    })
+    CREATE (ic)-[:HAD_INTERACTION]->(interaction)
+
+    // Connect the interaction to its date of occurance.
+    WITH interaction, mc
+    MERGE (d:Date {
+        org_id: $org_id,
+        user_id: $user_id,
+        date: date($interaction_date)
+    })
+    CREATE (interaction)-[:HAS_OCCURRENCE_ON]->(d)
+
+    // Create the memory nodes, linked to the interaction, the user's memory collection and their source message positions.
+    WITH interaction, mc
+    CALL (interaction, mc) {
+        UNWIND RANGE(0, SIZE($memory_ids) - 1) AS idx
+        CREATE (memory:Memory {
+            org_id: $org_id,
+            user_id: $user_id,
+            agent_id: $agent_id,
+            interaction_id: $interaction_id,
+            memory_id: $memory_ids[idx],
+            memory: $memory_texts[idx],
+            obtained_at: $interaction_date
+        })
+        CREATE (interaction)<-[:INTERACTION_SOURCE]-(memory)
+        CREATE (mc)-[:INCLUDES]->(memory)
+
+        WITH interaction, memory, $source_positions[idx] AS all_memory_source_msg_pos
+        UNWIND all_memory_source_msg_pos AS source_msg_pos
+        CREATE (interaction)<-[:MESSAGE_SOURCE {msg_position: source_msg_pos}]-(memory)
+    }
+
+    // Link the new contary memories as updates to the old memory they contradicted.
+    CALL () {
+        UNWIND RANGE(0, SIZE($contrary_memory_ids) - 1) AS idx
+        MATCH (new_contrary_memory:Memory {org_id: $org_id, user_id: $user_id, memory_id: $contrary_memory_ids[idx]})
+        USING INDEX new_contrary_memory:Memory(org_id, user_id, memory_id)
+        MATCH (old_memory:Memory {org_id: $org_id, user_id: $user_id, memory_id: $existing_contrary_memory_ids[idx]})
+        USING INDEX old_memory:Memory(org_id, user_id, memory_id)
+        MERGE (new_contrary_memory)<-[:CONTRARY_UPDATE]-(old_memory)
+    }
+"""
+
+_Q_UPDATE_INTERACTION_DATE = """
+    MATCH (i:Interaction {
+        org_id: $org_id,
+        user_id: $user_id,
+        interaction_id: $interaction_id
+    })
+    USING INDEX i:Interaction(org_id, user_id, interaction_id)
+    SET i.updated_at = $updated_date, i.agent_id = $agent_id
+    MERGE (d:Date {
+        org_id: $org_id,
+        user_id: $user_id,
+        date: date($updated_date)
+    })
+    MERGE (i)-[:HAS_OCCURRENCE_ON]->(d)
+"""
+
+_Q_GET_INTERACTION = """
+    MATCH (interaction: Interaction {
+        org_id: $org_id,
+        user_id: $user_id,
+        interaction_id: $interaction_id
+    })
+    USING INDEX interaction:Interaction(org_id, user_id, interaction_id)
+
+    // Initialize messages/memories upfront
+    WITH interaction, [] AS messages, [] AS memories
+"""
+
+_Q_INTERACTION_MESSAGES = """
+    // Messages are stored in order, as the interaction's parallel role and content lists.
+    WITH interaction, [idx IN RANGE(0, SIZE(COALESCE(interaction.message_roles, [])) - 1) | {
+        msg_position: idx,
+        role: interaction.message_roles[idx],
+        content: interaction.message_contents[idx]
+    }] as messages, memories
+"""
+
+_Q_INTERACTION_MEMORIES = """
+    OPTIONAL MATCH (interaction)<-[:INTERACTION_SOURCE]-(mem:Memory)
+    OPTIONAL MATCH (mem)-[src:MESSAGE_SOURCE]->(srcInteraction)
+
+    WITH interaction, messages, mem, collect(src{.msg_position, role: srcInteraction.message_roles[src.msg_position], content: srcInteraction.message_contents[src.msg_position]}) AS msg_sources
+
+    OPTIONAL MATCH (user:User {org_id: mem.org_id, user_id: mem.user_id})
+    OPTIONAL MATCH (agent:Agent {org_id: mem.org_id, agent_id: mem.agent_id})
+
+    WITH interaction, messages, collect(mem{
+                                            .*,
+                                            memory: apoc.text.replace(
+                                                apoc.text.replace(mem.memory, '(?i)user_[a-z0-9\\-]+(?:\\'s)?', user.user_name),
+                                                '(?i)agent_[a-z0-9\\-]+(?:\\'s)?',  agent.agent_label
+                                            ),
+                                            message_sources: msg_sources
+                                            }) as memories
+"""
+
+_Q_RETURN_INTERACTION = """
+    RETURN interaction{
+        .org_id,
+        .user_id,
+        .agent_id,
+        .interaction_id,
+        .created_at,
+        .updated_at,
+        messages: messages,
+        memories: memories
+    } as interaction
+"""
+
+_Q_GET_ALL_USER_INTERACTIONS = """
+    // Cleverly transverse through dates to get interactions sorted, avoiding having to sort all user interaction nodes.
+    MATCH (d:Date {org_id: $org_id, user_id: $user_id})
+    WITH d ORDER BY d.date DESC
+    CALL (d) {
+        MATCH (d)<-[:HAS_OCCURRENCE_ON]-(interaction)
+        RETURN interaction ORDER BY interaction.updated_at DESC
+    }
+    WITH DISTINCT interaction SKIP $skip LIMIT $limit
+
+    // Initialize messages/memories upfront
+    WITH interaction, [] AS messages, [] AS memories
+"""
+
+_Q_DELETE_INTERACTION_AND_ITS_MEMORIES = """
+    MATCH (interaction: Interaction {
+        org_id: $org_id,
+        user_id: $user_id,
+        interaction_id: $interaction_id
+        })
+    USING INDEX interaction:Interaction(org_id, user_id, interaction_id)
+
+    OPTIONAL MATCH (interaction)<-[:INTERACTION_SOURCE]-(memory)
+    OPTIONAL MATCH (interaction)-[:HAS_OCCURRENCE_ON]->(date:Date) WHERE NOT (date)<-[:HAS_OCCURRENCE_ON]-()
+
+    WITH interaction, collect(DISTINCT memory) AS memories, collect(DISTINCT date) AS dates
+    WITH interaction, memories, dates, [memory IN memories | memory.memory_id] AS memoryIds
+    FOREACH (node IN memories + dates | DETACH DELETE node)
+    DETACH DELETE interaction
+
+    RETURN memoryIds
+"""
+
+_Q_DELETE_ALL_USER_INTERACTIONS = """
+    MATCH (u:User {org_id: $org_id, user_id: $user_id})-[:INTERACTIONS_IN]->(ic)-[:HAD_INTERACTION]->(interaction:Interaction)
+    USING INDEX u:User(org_id, user_id)
+
+    OPTIONAL MATCH (interaction)<-[:INTERACTION_SOURCE]-(memory:Memory)
+    OPTIONAL MATCH (interaction)-[:HAS_OCCURRENCE_ON]->(date:Date)
+
+    DETACH DELETE interaction, memory, date
+"""
+
+
+def _to_neo4j_datetime(value: datetime) -> neo4j.time.DateTime:
+    """
+    Converts a datetime to a Neo4j DateTime, to be bound as a temporal query parameter (parsed once, client side).
+
+    Note:
+        Naive datetimes are taken as UTC, like Cypher's `datetime()` does for an ISO string without an offset.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return neo4j.time.DateTime.from_native(value)
+
+
+def _new_memory_ids(count: int) -> List[str]:
+    """
+    Generates `count` random (version 4) UUID strings for new memories, from a single read of the OS randomness source.
+
+    Note:
+        The ids are kept in the hyphenated form (not `.hex`), as that is how the vector database returns point ids,
+        and memories found there are resolved in the graph by `memory_id`.
+    """
+    random_bytes = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=random_bytes[start : start + 16], version=4))
+        for start in range(0, 16 * count, 16)
+    ]
 
 
 class Neo4jInteraction(BaseGraphDB):
 
-    async def _add_messages_to_interaction_from_top(
-        self,
-        tx,
-        org_id: str,
-        user_id: str,
-        interaction_id: str,
-        messages: List[Dict[str, str]],
-    ) -> None:
-        """Add messages to an interaction from the very top, linking the first message to the interaction."""
-
-        if messages:  # Called only if there are messages to be added.
-            await tx.run(
-                """
-                    MATCH (interaction:Interaction {
-                        org_id: $org_id, 
-                        user_id: $user_id, 
-                        interaction_id: $interaction_id
-                    })
-
-                    CREATE (msg1:MessageBlock {msg_position: 0, role: $messages[0].role, content: $messages[0].content})
-                    CREATE (interaction)-[:FIRST_MESSAGE]->(msg1)
-
-                    // Step 1: Create the remaining message nodes and collect them in a list.
-                    WITH msg1
-                    UNWIND RANGE(1, SIZE($messages) - 1) AS idx
-                    CREATE (msg:MessageBlock {msg_position: idx, role: $messages[idx].role, content: $messages[idx].content})
-
-                    // Step 2: Create a chain with the messages all connected via IS_NEXT from the first message.
-                    WITH msg1, COLLECT(msg) AS nodeList
-                    WITH [msg1] + nodeList AS nodeList
-
-                    UNWIND RANGE(1, SIZE(nodeList) - 1) AS idx
-                    WITH nodeList[idx] AS currentNode, nodeList[idx - 1] AS previousNode
-                    CREATE (previousNode)-[:IS_NEXT]->(currentNode)
-
-                """,
-                org_id=org_id,
-                user_id=user_id,
-                interaction_id=interaction_id,
-                messages=messages,
-            )
+    @asynccontextmanager
+    async def _session(self, write: bool) -> AsyncIterator[neo4j.AsyncSession]:
+        """Opens a session on the database with write or read access mode."""
 
-    async def _append_messages_to_interaction(
-        self,
-        tx,
-        org_id: str,
-        user_id: str,
-        interaction_id: str,
-        messages: List[Dict[str, str]],
-    ) -> None:
-        """Finds the last message in the interaction and links (append) this chain of new messages to it."""
-
-        await tx.run(
-            """
-                    // Find the last message in the interaction.
-                    MATCH p=(interaction: Interaction {org_id: $org_id, user_id: $user_id, interaction_id: $interaction_id})-[r:FIRST_MESSAGE|IS_NEXT*]->(m:MessageBlock)
-                    WHERE NOT (m)-[:IS_NEXT]->()
-
-                    // Create the update messages from truncation point.
-                    UNWIND RANGE(m.msg_position+1, SIZE($messages) - 1) AS idx
-                    CREATE (msg:MessageBlock {msg_position: idx, role: $messages[idx].role, content: $messages[idx].content})
-
-                    // Create a chain with the update messages all connected via IS_NEXT.
-                    WITH m, COLLECT(msg) AS nodeList
-                    WITH [m] + nodeList AS nodeList
-                    UNWIND RANGE(1, SIZE(nodeList) - 1) AS idx
-                    WITH nodeList[idx] AS currentNode, nodeList[idx - 1] AS previousNode
-                    CREATE (previousNode)-[:IS_NEXT]->(currentNode)
-                """,
-            org_id=org_id,
-            user_id=user_id,
-            interaction_id=interaction_id,
-            messages=messages,
-        )
+        async with self.driver.session(
+            database=self.database,
+            default_access_mode=neo4j.WRITE_ACCESS if write else neo4j.READ_ACCESS,
+        ) as session:
+            yield session
 
-    async def _truncate_interaction_message_below_point(
+    async def _update_interaction_messages(
         self,
         tx,
         org_id: str,
         user_id: str,
         interaction_id: str,
-        truncation_point_inclusive: int,
-    ) -> None:
+        messages: List[Dict[str, str]],
+    ) -> Tuple[int, int, int]:
         """
-        Will truncate every message in an interaction below the given truncation point.
+        Compares the updated messages with the existing messages of an interaction, truncates the existing messages from
+        the first point of difference and adds the updated messages from there, all in a single query.
 
         Note:
-            - `truncation_point_inclusive` is zero indexed and inclusive so `truncation_point_inclusive = n` will start deleting from the message at `nth` position.
-            - Setting `truncation_point_inclusize` to 0 will delete all messages of the interaction.
+            - Old memories from truncated message(s) remain but become standalone (no longer linked to truncated messages).
+            - If no differences are found, the new messages are simply appended.
+
+        Returns:
+            Tuple[int, int, int] containing:
+
+                + truncate_from: Zero indexed position the existing messages were truncated / appended from.
+                + truncated_count: Number of existing messages that were truncated.
+                + added_count: Number of messages that were added.
 
         Raises:
-            ValueError: When `truncation_point_inclusive` is < 0 (Less than Zero).
+            neo4j.exceptions.Neo4jError: When the interaction does not exist.
         """
 
-        if truncation_point_inclusive == 0:
-            # Delete every message in the interaction:
-            await tx.run(
-                """
-                MATCH (interaction: Interaction {org_id: $org_id, user_id: $user_id, interaction_id: $interaction_id})-[r:FIRST_MESSAGE|IS_NEXT*]->(m:MessageBlock)
-                DETACH DELETE m
-            """,
-                org_id=org_id,
-                user_id=user_id,
-                interaction_id=interaction_id,
-            )
+        result = await tx.run(
+            _Q_UPDATE_INTERACTION_MESSAGES,
+            org_id=org_id,
+            user_id=user_id,
+            interaction_id=interaction_id,
+            message_roles=[message["role"] for message in messages],
+            message_contents=[message["content"] for message in messages],
+        )
 
-        elif truncation_point_inclusive > 0:
-            # Delete all messages in the interaction below the truncation point.
-            await tx.run(
-                f"""
-                MATCH (interaction: Interaction {{org_id: $org_id, user_id: $user_id, interaction_id: $interaction_id}})-[r:FIRST_MESSAGE|IS_NEXT*{truncation_point_inclusive}]->(m:MessageBlock)
-                MATCH (m)-[:IS_NEXT*]->(n)
-                DETACH DELETE n
-            """,
-                org_id=org_id,
-                user_id=user_id,
-                interaction_id=interaction_id,
+        record = await result.single()
+        if record is None:
+            raise neo4j.exceptions.Neo4jError(
+                "Interaction (`org_id`, `user_id`, `interaction_id`) does not exist."
             )
 
-        else:
-            raise ValueError(
-                "`truncation_point_inclusive` should be > 0 (Greater than Zero)."
-            )
+        return record["truncateFrom"], record["truncatedCount"], record["addedCount"]
 
     async def _add_memories_with_their_source_links(
         self,
@@ -145,62 +347,27 @@ class Neo4jInteraction(BaseGraphDB):
         user_id: str,
         agent_id: str,
         interaction_id: str,
-        memories_and_interaction: MemoriesAndInteraction,
-        new_memory_ids: List[str],
-        new_contrary_memory_ids: List[str],
+        interaction_date: datetime,
+        all_memory_ids: List[str],
+        all_memory_texts: List[str],
+        all_memories: List[MemoryToStore],
     ) -> None:
-        """Add all memories and link to their source message and interaction."""
-
-        await tx.run(
-            """
-                // Retrieve all messages in the interaction, and the users memory collection.
-                MATCH (interaction: Interaction {org_id: $org_id, user_id: $user_id, interaction_id: $interaction_id})-[r:FIRST_MESSAGE|IS_NEXT*]->(m:MessageBlock)
-                MATCH (user:User {org_id: $org_id, user_id: $user_id})-[:HAS_MEMORIES]->(mc)
-
-                WITH collect(m) as messages, interaction, mc
-
-                // Create the memory nodes.
-                UNWIND $memories_and_source as memory_tuple
-                CREATE (memory:Memory {
-                    org_id: $org_id, 
-                    user_id: $user_id, 
-                    agent_id: $agent_id,
-                    interaction_id: $interaction_id, 
-                    memory_id: memory_tuple[0],  
-                    memory: memory_tuple[1], 
-                    obtained_at: datetime($interaction_date)
-                })
-                
-                // Link to interaction
-                CREATE (interaction)<-[:INTERACTION_SOURCE]-(memory)
-
-                // Link to user's memory collection
-                CREATE (mc)-[:INCLUDES]->(memory)
-
-                // For each memory, Link to it's source message in the interaction.
-                WITH memory, memory_tuple[2] as all_memory_source_msg_pos, messages
-                UNWIND all_memory_source_msg_pos as source_msg_pos
-
-                WITH messages[source_msg_pos] as message_node, memory
-                CREATE (message_node)<-[:MESSAGE_SOURCE]-(memory)
-
-            """,
+        """Add all memories (new & new contrary, in the same order as their ids and texts) and link to their source message and interaction."""
+
+        result = await tx.run(
+            _Q_ADD_MEMORIES_WITH_THEIR_SOURCE_LINKS,
             org_id=org_id,
             user_id=user_id,
             agent_id=agent_id,
             interaction_id=interaction_id,
-            interaction_date=memories_and_interaction.interaction_date.isoformat(),
-            memories_and_source=[
-                (memory_id, memory_obj.memory, memory_obj.source_msg_block_pos)
-                for memory_id, memory_obj in zip(
-                    (new_memory_ids + new_contrary_memory_ids),  # All memory ids
-                    (
-                        memories_and_interaction.memories
-                        + memories_and_interaction.contrary_memories
-                    ),  # All memories
-                )
+            interaction_date=_to_neo4j_datetime(interaction_date),
+            memory_ids=all_memory_ids,
+            memory_texts=all_memory_texts,
+            source_positions=[
+                memory_obj.source_msg_block_pos for memory_obj in all_memories
             ],
         )
+        await result.consume()
 
     async def _link_update_contrary_memories_to_existing_memories(
         self,
@@ -212,24 +379,65 @@ class Neo4jInteraction(BaseGraphDB):
     ) -> None:
         """Link the new contary memories as updates to the old memory they contradicted."""
 
-        await tx.run(
-            """
-                UNWIND $contrary_and_existing_ids as contrary_and_existing_id_tuple
-                MATCH (new_contrary_memory:Memory {org_id: $org_id, user_id: $user_id, memory_id: contrary_and_existing_id_tuple[0]})
-                MATCH (old_memory:Memory {org_id: $org_id, user_id: $user_id, memory_id: contrary_and_existing_id_tuple[1]})
-                
-                MERGE (new_contrary_memory)<-[:CONTRARY_UPDATE]-(old_memory)
-
-            """,
+        result = await tx.run(
+            _Q_LINK_CONTRARY_MEMORIES,
             org_id=org_id,
             user_id=user_id,
-            contrary_and_existing_ids=[
-                (contrary_memory_id, contrary_memory_obj.existing_contrary_memory_id)
-                for contrary_memory_id, contrary_memory_obj in zip(
-                    new_contrary_memory_ids, memories_and_interaction.contrary_memories
-                )
+            contrary_memory_ids=new_contrary_memory_ids,
+            existing_contrary_memory_ids=[
+                contrary_memory_obj.existing_contrary_memory_id
+                for contrary_memory_obj in memories_and_interaction.contrary_memories
             ],
         )
+        await result.consume()
+
+    async def _gather_with_vector_db_add(
+        self,
+        graph_writes: Awaitable[None],
+        org_id: str,
+        user_id: str,
+        agent_id: str,
+        memory_ids: List[str],
+        memories: List[str],
+        obtained_at: str,
+    ) -> None:
+        """
+        Runs the graph writes of a transaction function concurrently with adding the memories to the associated vector database.
+
+        The graph writes must be awaited in sequence on the transaction (they depend on each other and a transaction
+        is not coroutine-safe), but the vector database is a separate store, so its round-trips overlap with them.
+
+        Note:
+            - If either side fails, the memories are deleted from the vector database again before the error is raised,
+            so the rollback of the graph transaction leaves both stores consistent.
+            - `associated_vector_db.add_memories` must be cancel-safe, as it is cancelled along with the graph writes
+            if the calling task is cancelled.
+        """
+
+        graph_result, vector_db_result = await asyncio.gather(
+            graph_writes,
+            self.associated_vector_db.add_memories(
+                org_id=org_id,
+                user_id=user_id,
+                agent_id=agent_id,
+                memory_ids=memory_ids,
+                memories=memories,
+                obtained_at=obtained_at,
+            ),
+            return_exceptions=True,
+        )
+
+        errors = [
+            result
+            for result in (graph_result, vector_db_result)
+            if isinstance(result, BaseException)
+        ]
+        if errors:
+            self.logger.info("Removing memories from vector database as save failed")
+            try:
+                await self.associated_vector_db.delete_memories(memory_ids)
+            finally:
+                raise errors[0]
 
     @override
     async def save_interaction_with_memories(
@@ -266,123 +474,84 @@ class Neo4jInteraction(BaseGraphDB):
             )
 
         interaction_id = shortuuid.uuid()
-        new_memory_ids = [
-            str(uuid.uuid4()) for _ in range(len(memories_and_interaction.memories))
-        ]
-        new_contrary_memory_ids = [
-            str(uuid.uuid4())
-            for _ in range(len(memories_and_interaction.contrary_memories))
-        ]
+        new_memory_ids = _new_memory_ids(len(memories_and_interaction.memories))
+        new_contrary_memory_ids = _new_memory_ids(
+            len(memories_and_interaction.contrary_memories)
+        )
+        all_memory_ids = new_memory_ids + new_contrary_memory_ids
+        all_memories = (
+            memories_and_interaction.memories
+            + memories_and_interaction.contrary_memories
+        )
+        all_memory_texts = [memory_obj.memory for memory_obj in all_memories]
 
         self.logger.info(
             f"Saving interaction {interaction_id} for user {user_id} with agent {agent_id}"
         )
 
-        async def save_tx(tx):
+        if not memories_and_interaction.interaction:
+            # Memories are linked to their source messages, so none are stored without messages.
+            self.logger.info(f"No messages to save for interaction {interaction_id}")
+            new_contrary_memory_ids, all_memory_ids = [], []
+            all_memories, all_memory_texts = [], []
 
-            # Create interaction and connect to date of occurance.
-            await tx.run(
-                """
-                MATCH (u:User {org_id: $org_id, user_id: $user_id})-[:INTERACTIONS_IN]->(ic)
-                CREATE (interaction:Interaction {
-                    org_id: $org_id,
-                    user_id: $user_id,
-                    agent_id: $agent_id,
-                    interaction_id: $interaction_id,
-                    created_at: datetime($interaction_date),
-                    updated_at: datetime($interaction_date)
-                })
-                CREATE (ic)-[:HAD_INTERACTION]->(interaction)
-
-                WITH interaction, u
-                MERGE (d:Date {
-                    org_id: $org_id,
-                    user_id: $user_id,
-                    date: date(datetime($interaction_date))
-                })
-                CREATE (interaction)-[:HAS_OCCURRENCE_ON]->(d)
-
-            """,
-                org_id=org_id,
-                user_id=user_id,
-                agent_id=agent_id,
-                interaction_id=interaction_id,
-                interaction_date=memories_and_interaction.interaction_date.isoformat(),
-            )
+        async def save_tx(tx):
 
-            if not memories_and_interaction.interaction:
+            async def save_interaction_messages_and_memories():
+                # Create the interaction, its messages, memories and contrary memory links in a single round-trip.
                 self.logger.info(
-                    f"No messages to save for interaction {interaction_id}"
+                    f"Adding interaction {interaction_id} with its messages and memories"
                 )
-                return (
-                    interaction_id,
-                    memories_and_interaction.interaction_date.isoformat(),
-                )
-
-            # Add the messages to the interaction.
-            self.logger.info(f"Adding messages to interaction {interaction_id}")
-            await self._add_messages_to_interaction_from_top(
-                tx,
-                org_id,
-                user_id,
-                interaction_id,
-                memories_and_interaction.interaction,
-            )
-
-            if new_memory_ids or new_contrary_memory_ids:
-                # Add the all memories (new & new contrary) and connect to their interaction message source.
-                self.logger.info("Adding memories and linking to their message source")
-                await self._add_memories_with_their_source_links(
-                    tx,
-                    org_id,
-                    user_id,
-                    agent_id,
-                    interaction_id,
-                    memories_and_interaction,
-                    new_memory_ids,
-                    new_contrary_memory_ids,
+                result = await tx.run(
+                    _Q_SAVE_INTERACTION_WITH_MEMORIES,
+                    org_id=org_id,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    interaction_id=interaction_id,
+                    interaction_date=_to_neo4j_datetime(
+                        memories_and_interaction.interaction_date
+                    ),
+                    message_roles=[
+                        message["role"]
+                        for message in memories_and_interaction.interaction
+                    ],
+                    message_contents=[
+                        message["content"]
+                        for message in memories_and_interaction.interaction
+                    ],
+                    # Memory fields and contrary links are sent as parallel (columnar) lists.
+                    memory_ids=all_memory_ids,
+                    memory_texts=all_memory_texts,
+                    source_positions=[
+                        memory_obj.source_msg_block_pos for memory_obj in all_memories
+                    ],
+                    contrary_memory_ids=new_contrary_memory_ids,
+                    existing_contrary_memory_ids=[
+                        contrary_memory_obj.existing_contrary_memory_id
+                        for contrary_memory_obj in memories_and_interaction.contrary_memories
+                    ],
                 )
+                await result.consume()
 
-            if new_contrary_memory_ids:
-                # Link the new contary memories as updates to the old memory they contradicted.
-                self.logger.info(
-                    "Linking contrary memories to existing memories they contradicted"
-                )
-                await self._link_update_contrary_memories_to_existing_memories(
-                    tx,
-                    org_id,
-                    user_id,
-                    new_contrary_memory_ids,
-                    memories_and_interaction,
+            if (
+                all_memory_ids and self.associated_vector_db
+            ):  # If the graph database is associated with a vector database
+                # Add memories to vector DB alongside the graph writes, within this transcation function to ensure data consistency (They succeed or fail together).
+                await self._gather_with_vector_db_add(
+                    save_interaction_messages_and_memories(),
+                    org_id=org_id,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    memory_ids=all_memory_ids,
+                    memories=all_memory_texts,
+                    obtained_at=memories_and_interaction.interaction_date.isoformat(),
                 )
-
-            if new_memory_ids or new_contrary_memory_ids:
-                if (
-                    self.associated_vector_db
-                ):  # If the graph database is associated with a vector database
-                    # Add memories to vector DB within this transcation function to ensure data consistency (They succeed or fail together).
-                    await self.associated_vector_db.add_memories(
-                        org_id=org_id,
-                        user_id=user_id,
-                        agent_id=agent_id,
-                        memory_ids=(
-                            new_memory_ids + new_contrary_memory_ids
-                        ),  # All memory ids
-                        memories=[
-                            memory_obj.memory
-                            for memory_obj in (
-                                memories_and_interaction.memories
-                                + memories_and_interaction.contrary_memories
-                            )
-                        ],  # All memories
-                        obtained_at=memories_and_interaction.interaction_date.isoformat(),
-                    )
+            else:
+                await save_interaction_messages_and_memories()
 
             return interaction_id, memories_and_interaction.interaction_date
 
-        async with self.driver.session(
-            database=self.database, default_access_mode=neo4j.WRITE_ACCESS
-        ) as session:
+        async with self._session(write=True) as session:
             result = await session.execute_write(save_tx)
             self.logger.info(
                 f"Successfully saved interaction {interaction_id} for user {user_id}"
@@ -437,124 +606,34 @@ class Neo4jInteraction(BaseGraphDB):
             f"Updating interaction {interaction_id} for user {user_id} with agent {agent_id}"
         )
 
-        new_memory_ids = [
-            str(uuid.uuid4())
-            for _ in range(len(updated_memories_and_interaction.memories))
-        ]
-        new_contrary_memory_ids = [
-            str(uuid.uuid4())
-            for _ in range(len(updated_memories_and_interaction.contrary_memories))
-        ]
-
-        # First get the existing messages.
-        existing_messages: List[models.MessageBlock] = (
-            await self.get_interaction(
-                org_id, user_id, interaction_id, with_messages=True, with_memories=False
-            )
-        ).messages
-
-        updated_interaction_length = len(updated_memories_and_interaction.interaction)
-        existing_interaction_length = len(existing_messages)
+        new_memory_ids = _new_memory_ids(len(updated_memories_and_interaction.memories))
+        new_contrary_memory_ids = _new_memory_ids(
+            len(updated_memories_and_interaction.contrary_memories)
+        )
+        all_memory_ids = new_memory_ids + new_contrary_memory_ids
+        all_memories = (
+            updated_memories_and_interaction.memories
+            + updated_memories_and_interaction.contrary_memories
+        )
+        all_memory_texts = [memory_obj.memory for memory_obj in all_memories]
 
         async def update_tx(tx):
 
-            # Case 1: Empty updated interaction - delete all existing messages
-            if updated_interaction_length == 0:
-                self.logger.info(
-                    f"Truncating all messages from interaction {interaction_id} as updated interaction is empty"
-                )
-                await self._truncate_interaction_message_below_point(
-                    tx, org_id, user_id, interaction_id, truncation_point_inclusive=0
-                )
-
-            # Case 2: Empty existing interaction - add all new messages from the top
-            elif existing_interaction_length == 0:
-                self.logger.info(f"Adding all messages to interaction {interaction_id}")
-                await self._add_messages_to_interaction_from_top(
+            # Truncate the existing messages from the first point of difference and add the updated messages from there.
+            truncate_from, truncated_count, added_count = (
+                await self._update_interaction_messages(
                     tx,
                     org_id,
                     user_id,
                     interaction_id,
                     updated_memories_and_interaction.interaction,
                 )
+            )
+            self.logger.info(
+                f"Updated messages in interaction {interaction_id} from position {truncate_from}: {truncated_count} truncated, {added_count} added"
+            )
 
-            # Case 3: Both interactions have messages - compare and update
-            else:
-                # Find first point of difference
-                truncate_from = -1
-                for i in range(
-                    min(existing_interaction_length, updated_interaction_length)
-                ):
-                    if (
-                        existing_messages[i].role
-                        != updated_memories_and_interaction.interaction[i].get("role")
-                    ) or (
-                        existing_messages[i].content
-                        != updated_memories_and_interaction.interaction[i].get(
-                            "content"
-                        )
-                    ):
-                        truncate_from = i
-                        break
-
-                # If no differences found in prefix messages, but updated interaction is shorter
-                if (
-                    truncate_from == -1
-                    and updated_interaction_length < existing_interaction_length
-                ):
-                    truncate_from = updated_interaction_length
-
-                # Handle different cases based on where the difference was found
-                if truncate_from == -1:
-                    # Append the new messages at the bottom.
-                    self.logger.info(
-                        f"Appending new messages to interaction {interaction_id}"
-                    )
-                    await self._append_messages_to_interaction(
-                        tx,
-                        org_id,
-                        user_id,
-                        interaction_id,
-                        updated_memories_and_interaction.interaction,
-                    )
-
-                elif truncate_from == 0:
-                    # Complete replacement needed
-                    self.logger.info(
-                        f"Storing latest interaction {interaction_id} messages"
-                    )
-                    await self._truncate_interaction_message_below_point(
-                        tx,
-                        org_id,
-                        user_id,
-                        interaction_id,
-                        truncation_point_inclusive=0,
-                    )
-                    await self._add_messages_to_interaction_from_top(
-                        tx,
-                        org_id,
-                        user_id,
-                        interaction_id,
-                        updated_memories_and_interaction.interaction,
-                    )
-
-                elif truncate_from > 0:
-                    # Partial replacement needed
-                    self.logger.info(
-                        f"Updating messages in interaction {interaction_id} from position {truncate_from}"
-                    )
-                    await self._truncate_interaction_message_below_point(
-                        tx, org_id, user_id, interaction_id, truncate_from
-                    )
-                    await self._append_messages_to_interaction(
-                        tx,
-                        org_id,
-                        user_id,
-                        interaction_id,
-                        updated_memories_and_interaction.interaction,
-                    )
-
-            if new_memory_ids or new_contrary_memory_ids:
+            if all_memory_ids:
                 self.logger.info("Adding memories and linking to their source messages")
                 await self._add_memories_with_their_source_links(
                     tx,
@@ -562,9 +641,10 @@ class Neo4jInteraction(BaseGraphDB):
                     user_id,
                     agent_id,
                     interaction_id,
-                    updated_memories_and_interaction,
-                    new_memory_ids,
-                    new_contrary_memory_ids,
+                    updated_memories_and_interaction.interaction_date,
+                    all_memory_ids,
+                    all_memory_texts,
+                    all_memories,
                 )
 
             if new_contrary_memory_ids:
@@ -580,29 +660,19 @@ class Neo4jInteraction(BaseGraphDB):
                 )
 
             # Update the interaction agent, updated_at datetime, and connect occurance to the particular date.
-            await tx.run(
-                """
-                MATCH (i:Interaction {
-                    org_id: $org_id,
-                    user_id: $user_id,
-                    interaction_id: $interaction_id
-                })
-                SET i.updated_at = datetime($updated_date), i.agent_id = $agent_id
-                MERGE (d:Date {
-                    org_id: $org_id,
-                    user_id: $user_id,
-                    date: date(datetime($updated_date))
-                })
-                MERGE (i)-[:HAS_OCCURRENCE_ON]->(d)
-            """,
+            result = await tx.run(
+                _Q_UPDATE_INTERACTION_DATE,
                 org_id=org_id,
                 user_id=user_id,
                 agent_id=agent_id,
                 interaction_id=interaction_id,
-                updated_date=updated_memories_and_interaction.interaction_date.isoformat(),
+                updated_date=_to_neo4j_datetime(
+                    updated_memories_and_interaction.interaction_date
+                ),
             )
+            await result.consume()
 
-            if new_memory_ids or new_contrary_memory_ids:
+            if all_memory_ids:
                 if self.associated_vector_db:
                     # If the graph database is associated with a vector database
                     # Add memories to vector DB within this transcation function to ensure data consistency (They succeed or fail together).
@@ -610,16 +680,8 @@ class Neo4jInteraction(BaseGraphDB):
                         org_id=org_id,
                         user_id=user_id,
                         agent_id=agent_id,
-                        memory_ids=(
-                            new_memory_ids + new_contrary_memory_ids
-                        ),  # All memory ids
-                        memories=[
-                            memory_obj.memory
-                            for memory_obj in (
-                                updated_memories_and_interaction.memories
-                                + updated_memories_and_interaction.contrary_memories
-                            )
-                        ],  # All memories
+                        memory_ids=all_memory_ids,
+                        memories=all_memory_texts,
                         obtained_at=updated_memories_and_interaction.interaction_date.isoformat(),
                     )
 
@@ -628,9 +690,7 @@ class Neo4jInteraction(BaseGraphDB):
                 updated_memories_and_interaction.interaction_date,
             )
 
-        async with self.driver.session(
-            database=self.database, default_access_mode=neo4j.WRITE_ACCESS
-        ) as session:
+        async with self._session(write=True) as session:
             result = await session.execute_write(update_tx)
             self.logger.info(f"Successfully updated interaction {interaction_id}")
             return result
@@ -682,57 +742,17 @@ class Neo4jInteraction(BaseGraphDB):
             f"Retrieving interaction {interaction_id} for user {user_id} with messages={with_messages} and memories={with_memories}"
         )
 
-        async def get_interaction_tx(tx):
-
-            query = """
-                MATCH (interaction: Interaction {
-                    org_id: $org_id, 
-                    user_id: $user_id, 
-                    interaction_id: $interaction_id
-                })
+        async def get_interaction_tx(tx, runtime_hint: str):
 
-                // Initialize messages/memories upfront
-                WITH interaction, [] AS messages, [] AS memories
-            """
+            query = runtime_hint + _Q_GET_INTERACTION
 
             if with_messages:
-                query += """
-                OPTIONAL MATCH (interaction)-[:FIRST_MESSAGE|IS_NEXT*]->(m:MessageBlock)
-                WITH interaction, collect(m{.*}) as messages, memories
-                """
+                query += _Q_INTERACTION_MESSAGES
 
             if with_memories:
-                query += """
-                OPTIONAL MATCH (interaction)<-[:INTERACTION_SOURCE]-(mem:Memory)
-                OPTIONAL MATCH (mem)-[:MESSAGE_SOURCE]->(msg)
-
-                WITH interaction, messages, mem, collect(msg{.*}) AS msg_sources
-
-                OPTIONAL MATCH (user:User {org_id: mem.org_id, user_id: mem.user_id})              
-                OPTIONAL MATCH (agent:Agent {org_id: mem.org_id, agent_id: mem.agent_id})
-
-                WITH interaction, messages, collect(mem{
-                                                        .*, 
-                                                        memory: apoc.text.replace(
-                                                            apoc.text.replace(mem.memory, '(?i)user_[a-z0-9\\-]+(?:\\'s)?', user.user_name), 
-                                                            '(?i)agent_[a-z0-9\\-]+(?:\\'s)?',  agent.agent_label
-                                                        ),
-                                                        message_sources: msg_sources
-                                                        }) as memories
-                """
-
-            query += """
-                RETURN interaction{
-                    .org_id,
-                    .user_id,
-                    .agent_id,
-                    .interaction_id,
-                    .created_at,
-                    .updated_at,
-                    messages: messages,
-                    memories: memories
-                } as interaction
-            """
+                query += _Q_INTERACTION_MEMORIES
+
+            query += _Q_RETURN_INTERACTION
 
             result = await tx.run(
                 query,
@@ -744,55 +764,59 @@ class Neo4jInteraction(BaseGraphDB):
             record = await result.single()
             return record["interaction"] if record else None
 
-        async with self.driver.session(
-            database=self.database, default_access_mode=neo4j.READ_ACCESS
-        ) as session:
-            interaction_data = await session.execute_read(get_interaction_tx)
+        async with self._session(write=False) as session:
+            interaction_data = await execute_read_in_parallel_runtime(
+                session,
+                get_interaction_tx,
+                self.parallel_runtime_reads,
+                self.parallel_runtime_unsupported_reads,
+                self.logger,
+            )
 
-            if interaction_data is None:
-                self.logger.info(
-                    f"Interaction {interaction_id} not found for user {user_id}"
+        if interaction_data is None:
+            self.logger.info(
+                f"Interaction {interaction_id} not found for user {user_id}"
+            )
+            raise neo4j.exceptions.Neo4jError(
+                "Interaction (`org_id`, `user_id`, `interaction_id`) does not exist."
+            )
+
+        return models.Interaction(
+            org_id=interaction_data["org_id"],
+            user_id=interaction_data["user_id"],
+            agent_id=interaction_data["agent_id"],
+            interaction_id=interaction_data["interaction_id"],
+            created_at=(interaction_data["created_at"]).to_native(),
+            updated_at=(interaction_data["updated_at"]).to_native(),
+            messages=[
+                models.MessageBlock(
+                    role=message.get("role"),
+                    content=message.get("content"),
+                    msg_position=message["msg_position"],
                 )
-                raise neo4j.exceptions.Neo4jError(
-                    "Interaction (`org_id`, `user_id`, `interaction_id`) does not exist."
+                for message in (interaction_data.get("messages") or [])
+            ],
+            memories=[
+                models.Memory(
+                    org_id=memory["org_id"],
+                    agent_id=memory["agent_id"],
+                    user_id=memory["user_id"],
+                    interaction_id=memory["interaction_id"],
+                    memory_id=memory["memory_id"],
+                    memory=memory["memory"],
+                    obtained_at=(memory["obtained_at"]).to_native(),
+                    message_sources=[
+                        models.MessageBlock(
+                            role=msg.get("role"),
+                            content=msg.get("content"),
+                            msg_position=msg["msg_position"],
+                        )
+                        for msg in (memory.get("message_sources") or [])
+                    ],
                 )
-
-            return models.Interaction(
-                org_id=interaction_data["org_id"],
-                user_id=interaction_data["user_id"],
-                agent_id=interaction_data["agent_id"],
-                interaction_id=interaction_data["interaction_id"],
-                created_at=(interaction_data["created_at"]).to_native(),
-                updated_at=(interaction_data["updated_at"]).to_native(),
-                messages=[
-                    models.MessageBlock(
-                        role=message.get("role"),
-                        content=message.get("content"),
-                        msg_position=message["msg_position"],
-                    )
-                    for message in (interaction_data.get("messages") or [])
-                ],
-                memories=[
-                    models.Memory(
-                        org_id=memory["org_id"],
-                        agent_id=memory["agent_id"],
-                        user_id=memory["user_id"],
-                        interaction_id=memory["interaction_id"],
-                        memory_id=memory["memory_id"],
-                        memory=memory["memory"],
-                        obtained_at=(memory["obtained_at"]).to_native(),
-                        message_sources=[
-                            models.MessageBlock(
-                                role=msg.get("role"),
-                                content=msg.get("content"),
-                                msg_position=msg["msg_position"],
-                            )
-                            for msg in (memory.get("message_sources") or [])
-                        ],
-                    )
-                    for memory in (interaction_data.get("memories") or [])
-                ],
-            )
+                for memory in (interaction_data.get("memories") or [])
+            ],
+        )
 
     @override
     async def get_all_user_interactions(
@@ -844,112 +868,74 @@ class Neo4jInteraction(BaseGraphDB):
             f"Retrieving all interactions for user {user_id} with messages={with_their_messages} and memories={with_their_memories}"
         )
 
-        async def get_interactions_tx(tx):
-
-            query = """
-                // Cleverly transverse through dates to get interactions sorted, avoiding having to sort all user interaction nodes.
-                MATCH (d:Date {org_id: $org_id, user_id: $user_id})
-                WITH d ORDER BY d.date DESC
-                CALL (d) {
-                    MATCH (d)<-[:HAS_OCCURRENCE_ON]-(interaction)
-                    RETURN interaction ORDER BY interaction.updated_at DESC
-                }
-                WITH DISTINCT interaction SKIP $skip LIMIT $limit
+        async def get_interactions_tx(tx, runtime_hint: str):
 
-                // Initialize messages/memories upfront
-                WITH interaction, [] AS messages, [] AS memories 
-            """
+            query = runtime_hint + _Q_GET_ALL_USER_INTERACTIONS
 
             if with_their_messages:
-                query += """
-                OPTIONAL MATCH (interaction)-[:FIRST_MESSAGE|IS_NEXT*]->(m:MessageBlock)
-                WITH interaction, collect(m{.*}) as messages, memories
-                """
+                query += _Q_INTERACTION_MESSAGES
 
             if with_their_memories:
-                query += """
-                OPTIONAL MATCH (interaction)<-[:INTERACTION_SOURCE]-(mem:Memory)
-                OPTIONAL MATCH (mem)-[:MESSAGE_SOURCE]->(msg)
-
-                WITH interaction, messages, mem, collect(msg{.*}) AS msg_sources
-                
-                OPTIONAL MATCH (user:User {org_id: mem.org_id, user_id: mem.user_id})              
-                OPTIONAL MATCH (agent:Agent {org_id: mem.org_id, agent_id: mem.agent_id})
-
-                WITH interaction, messages, collect(mem{
-                                                        .*, 
-                                                        memory: apoc.text.replace(
-                                                            apoc.text.replace(mem.memory, '(?i)user_[a-z0-9\\-]+(?:\\'s)?', user.user_name), 
-                                                            '(?i)agent_[a-z0-9\\-]+(?:\\'s)?',  agent.agent_label
-                                                        ),
-                                                        message_sources: msg_sources
-                                                        }) as memories
-                """
-
-            query += """
-                RETURN interaction{
-                    .org_id,
-                    .user_id,
-                    .agent_id,
-                    .interaction_id,
-                    .created_at,
-                    .updated_at,
-                    messages: messages,
-                    memories: memories
-                } as interaction
-            """
+                query += _Q_INTERACTION_MEMORIES
+
+            query += _Q_RETURN_INTERACTION
 
             result = await tx.run(
                 query, org_id=org_id, user_id=user_id, skip=skip, limit=limit
             )
 
-            records = await result.value("interaction", [])
-            return records
-
-        async with self.driver.session(
-            database=self.database, default_access_mode=neo4j.READ_ACCESS
-        ) as session:
-            all_interactions_data = await session.execute_read(get_interactions_tx)
-
-            return [
-                models.Interaction(
-                    org_id=interaction_data["org_id"],
-                    user_id=interaction_data["user_id"],
-                    agent_id=interaction_data["agent_id"],
-                    interaction_id=interaction_data["interaction_id"],
-                    created_at=(interaction_data["created_at"]).to_native(),
-                    updated_at=(interaction_data["updated_at"]).to_native(),
-                    messages=[
-                        models.MessageBlock(
-                            role=message.get("role"),
-                            content=message.get("content"),
-                            msg_position=message["msg_position"],
-                        )
-                        for message in (interaction_data.get("messages") or [])
-                    ],
-                    memories=[
-                        models.Memory(
-                            org_id=memory["org_id"],
-                            agent_id=memory["agent_id"],
-                            user_id=memory["user_id"],
-                            interaction_id=memory["interaction_id"],
-                            memory_id=memory["memory_id"],
-                            memory=memory["memory"],
-                            obtained_at=(memory["obtained_at"]).to_native(),
-                            message_sources=[
-                                models.MessageBlock(
-                                    role=msg.get("role"),
-                                    content=msg.get("content"),
-                                    msg_position=msg["msg_position"],
-                                )
-                                for msg in (memory.get("message_sources") or [])
-                            ],
-                        )
-                        for memory in (interaction_data.get("memories") or [])
-                    ],
+            # Build each interaction as its record streams in, instead of first materializing all records.
+            interactions: List[models.Interaction] = []
+            async for record in result:
+                interaction_data = record["interaction"]
+                interactions.append(
+                    models.Interaction(
+                        org_id=interaction_data["org_id"],
+                        user_id=interaction_data["user_id"],
+                        agent_id=interaction_data["agent_id"],
+                        interaction_id=interaction_data["interaction_id"],
+                        created_at=(interaction_data["created_at"]).to_native(),
+                        updated_at=(interaction_data["updated_at"]).to_native(),
+                        messages=[
+                            models.MessageBlock(
+                                role=message.get("role"),
+                                content=message.get("content"),
+                                msg_position=message["msg_position"],
+                            )
+                            for message in (interaction_data.get("messages") or [])
+                        ],
+                        memories=[
+                            models.Memory(
+                                org_id=memory["org_id"],
+                                agent_id=memory["agent_id"],
+                                user_id=memory["user_id"],
+                                interaction_id=memory["interaction_id"],
+                                memory_id=memory["memory_id"],
+                                memory=memory["memory"],
+                                obtained_at=(memory["obtained_at"]).to_native(),
+                                message_sources=[
+                                    models.MessageBlock(
+                                        role=msg.get("role"),
+                                        content=msg.get("content"),
+                                        msg_position=msg["msg_position"],
+                                    )
+                                    for msg in (memory.get("message_sources") or [])
+                                ],
+                            )
+                            for memory in (interaction_data.get("memories") or [])
+                        ],
+                    )
                 )
-                for interaction_data in all_interactions_data
-            ]
+            return interactions
+
+        async with self._session(write=False) as session:
+            return await execute_read_in_parallel_runtime(
+                session,
+                get_interactions_tx,
+                self.parallel_runtime_reads,
+                self.parallel_runtime_unsupported_reads,
+                self.logger,
+            )
 
     @override
     async def delete_user_interaction_and_its_memories(
@@ -968,6 +954,9 @@ class Neo4jInteraction(BaseGraphDB):
 
         Note:
             If the graph database is associated with a vector database, the memories are also deleted there for data consistency.
+
+        Raises:
+            neo4j.exceptions.Neo4jError: When the interaction does not exist.
         """
 
         if not all(
@@ -982,45 +971,34 @@ class Neo4jInteraction(BaseGraphDB):
             f"Deleting interaction {interaction_id} and its memories for user {user_id}"
         )
 
-        interaction_memories = (
-            await self.get_interaction(
-                org_id, user_id, interaction_id, with_messages=False, with_memories=True
-            )
-        ).memories
-
-        interaction_memories_ids = [memory.memory_id for memory in interaction_memories]
-
         async def delete_tx(tx):
-            # Delete the interaction, its messages and memories.
-            await tx.run(
-                """
-                MATCH (interaction: Interaction {
-                    org_id: $org_id, 
-                    user_id: $user_id, 
-                    interaction_id: $interaction_id
-                    })-[r:FIRST_MESSAGE|IS_NEXT*]->(message:MessageBlock)
-
-                OPTIONAL MATCH (interaction)<-[:INTERACTION_SOURCE]-(memory)
-                OPTIONAL MATCH (interaction)-[:HAS_OCCURRENCE_ON]->(date:Date) WHERE NOT (date)<-[:HAS_OCCURRENCE_ON]-()
-
-                DETACH DELETE interaction, message, memory, date
-            """,
+            # Delete the interaction and its memories, returning the deleted memory ids in the same round-trip.
+            result = await tx.run(
+                _Q_DELETE_INTERACTION_AND_ITS_MEMORIES,
                 org_id=org_id,
                 user_id=user_id,
                 interaction_id=interaction_id,
             )
 
+            record = await result.single()
+            if record is None:
+                self.logger.info(
+                    f"Interaction {interaction_id} not found for user {user_id}"
+                )
+                raise neo4j.exceptions.Neo4jError(
+                    "Interaction (`org_id`, `user_id`, `interaction_id`) does not exist."
+                )
+
+            interaction_memories_ids = record["memoryIds"]
             if (
                 self.associated_vector_db and interaction_memories_ids
             ):  # If the graph database is associated with a vector database
-                # Delete memories from vector DB.
+                # Delete memories from vector DB within this transaction function so the graph delete is rolled back if it fails.
                 await self.associated_vector_db.delete_memories(
                     interaction_memories_ids
                 )
 
-        async with self.driver.session(
-            database=self.database, default_access_mode=neo4j.WRITE_ACCESS
-        ) as session:
+        async with self._session(write=True) as session:
             await session.execute_write(delete_tx)
 
     @override
@@ -1037,7 +1015,10 @@ class Neo4jInteraction(BaseGraphDB):
             user_id (str): Short UUID string identifying the user whose interactions should be deleted
 
         Note:
-            If the graph database is associated with a vector database, the memories are also deleted there for data consistency.
+            - If the graph database is associated with a vector database, the memories are also deleted there for data consistency.
+            - Both deletes run concurrently, and both finish before either's error is raised. A failed vector database delete
+            then rolls back the graph delete, but if the graph delete fails, memories already deleted from the vector database
+            are not restored.
         """
 
         if not all(param and isinstance(param, str) for param in (org_id, user_id)):
@@ -1046,19 +1027,14 @@ class Neo4jInteraction(BaseGraphDB):
         self.logger.info(f"Deleting all interactions and memories for user {user_id}")
 
         async def delete_all_tx(tx):
-            await tx.run(
-                """
-                MATCH (u:User {org_id: $org_id, user_id: $user_id})-[:INTERACTIONS_IN]->(ic)-[:HAD_INTERACTION]->(interaction:Interaction)
-                
-                OPTIONAL MATCH (interaction)<-[:INTERACTION_SOURCE]-(memory:Memory)
-                OPTIONAL MATCH (interaction)-[:HAS_OCCURRENCE_ON]->(date:Date)
-                OPTIONAL MATCH (interaction)-[:FIRST_MESSAGE|IS_NEXT*]->(messages:MessageBlock)
-
-                DETACH DELETE interaction, memory, date, messages
-            """,
-                org_id=org_id,
-                user_id=user_id,
-            )
+
+            async def delete_all_user_interactions():
+                result = await tx.run(
+                    _Q_DELETE_ALL_USER_INTERACTIONS,
+                    org_id=org_id,
+                    user_id=user_id,
+                )
+                await result.consume()
 
             if (
                 self.associated_vector_db
@@ -1066,13 +1042,26 @@ class Neo4jInteraction(BaseGraphDB):
                 self.logger.info(
                     f"Deleting all memories from vector database for user {user_id}"
                 )
-                await self.associated_vector_db.delete_all_user_memories(
-                    org_id, user_id
-                )
+                # Concurrently, within this transaction function so the graph delete is rolled back if it fails.
+                # Both deletes are awaited to completion before an error is raised, as the transaction is only
+                # rolled back once this function raises, and must not be while the graph delete is still running on it.
+                errors = [
+                    result
+                    for result in await asyncio.gather(
+                        delete_all_user_interactions(),
+                        self.associated_vector_db.delete_all_user_memories(
+                            org_id, user_id
+                        ),
+                        return_exceptions=True,
+                    )
+                    if isinstance(result, BaseException)
+                ]
+                if errors:
+                    raise errors[0]
+            else:
+                await delete_all_user_interactions()
 
-        async with self.driver.session(
-            database=self.database, default_access_mode=neo4j.WRITE_ACCESS
-        ) as session:
+        async with self._session(write=True) as session:
             await session.execute_write(delete_all_tx)
             self.logger.info(
                 f"Successfully deleted all interactions and memories for user {user_id}"
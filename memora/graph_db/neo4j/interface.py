@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import Optional, Set
 
 import neo4j
 from neo4j import AsyncGraphDatabase
@@ -25,6 +25,10 @@ class Neo4jGraphInterface(
         database: str,
         associated_vector_db: Optional[BaseVectorDB] = None,
         enable_logging: bool = False,
+        max_connection_pool_size: int = 100,
+        connection_acquisition_timeout: float = 60.0,
+        max_connection_lifetime: float = 3600.0,
+        parallel_runtime_reads: bool = False,
     ):
         """
         A unified interface for interacting with the Neo4j graph database.
@@ -36,6 +40,13 @@ class Neo4jGraphInterface(
             database (str): The name of the Neo4j database.
             associated_vector_db (Optional[BaseVectorDB]): The vector database to be associated with the graph for data consistency (e.g adding / deleting memories across both.)
             enable_logging (bool): Whether to enable console logging
+            max_connection_pool_size (int): The maximum number of connections the driver keeps open to the database.
+                Under concurrent saves / updates, setting this to about twice the number of concurrent workers avoids them waiting on the pool.
+            connection_acquisition_timeout (float): Seconds to wait for a connection from the pool before failing.
+            max_connection_lifetime (float): Seconds a pooled connection is kept before it is closed and replaced.
+            parallel_runtime_reads (bool): Whether to run the heavier read queries (e.g. getting interactions, getting all users of an organization)
+                on Neo4j's parallel runtime, spreading them across CPU cores. Requires Neo4j Enterprise Edition / Aura (5.13+); queries the server
+                can't execute on it fall back to the default runtime.
 
         Example:
             ```python
@@ -54,8 +65,18 @@ class Neo4jGraphInterface(
             ```
         """
 
-        self.driver = AsyncGraphDatabase.driver(uri=uri, auth=(username, password))
+        # The native async driver, so the awaited session/transaction calls run on the event loop (not a thread pool).
+        self.driver: neo4j.AsyncDriver = AsyncGraphDatabase.driver(
+            uri=uri,
+            auth=(username, password),
+            max_connection_pool_size=max_connection_pool_size,
+            connection_acquisition_timeout=connection_acquisition_timeout,
+            max_connection_lifetime=max_connection_lifetime,
+        )
         self.database = database
+        self.parallel_runtime_reads = parallel_runtime_reads
+        # Reads the server rejected for the parallel runtime, run on the default runtime from then on.
+        self.parallel_runtime_unsupported_reads: Set[str] = set()
         self.associated_vector_db = associated_vector_db
 
         # Configure logging
@@ -182,3 +203,56 @@ class Neo4jGraphInterface(
             await session.execute_write(link_memories_to_dates)
             await session.execute_write(drop_index)
         self.logger.info("Migration of graph schema completed")
+
+    async def migrate_to_schema_for_memora_v0_4_x(self, *args, **kwargs) -> None:
+        """
+        Migrate the Neo4j graph database schema to the version that works with Memora v0.4.x
+
+        This migration involves moving the messages of every `Interaction` node from its chain of `MessageBlock` nodes into
+        the interaction's `message_roles` and `message_contents` list properties, relinking each memory's `:MESSAGE_SOURCE`
+        to the interaction (with the source message's `msg_position` on the relationship), then deleting the `MessageBlock` nodes.
+
+        Note:
+            Only interactions that still have a `MessageBlock` chain are converted, in batches of 1000 interactions
+            per transaction, so the migration is safe to re-run (e.g. after an interrupted run, or once new interactions exist).
+        """
+
+        self.logger.info(
+            "Starting migration to graph schema that works with Memora v0.4.x"
+        )
+        async with self.driver.session(
+            database=self.database, default_access_mode=neo4j.WRITE_ACCESS
+        ) as session:
+            self.logger.info(
+                "Moving MessageBlock nodes into their Interaction node's message lists"
+            )
+            # `CALL {...} IN TRANSACTIONS` must run in an auto-commit transaction, so not via `execute_write`.
+            result = await session.run(
+                """
+                MATCH (interaction:Interaction)-[:FIRST_MESSAGE]->(:MessageBlock)
+                CALL (interaction) {
+                    MATCH (interaction)-[:FIRST_MESSAGE|IS_NEXT*]->(m:MessageBlock)
+                    WITH interaction, m ORDER BY m.msg_position
+                    WITH interaction, collect(m) AS messages
+
+                    // Lists can't hold nulls in a property, so a message block without a role / content gets an empty one.
+                    SET interaction.message_roles = [m IN messages | coalesce(m.role, '')],
+                        interaction.message_contents = [m IN messages | coalesce(m.content, '')]
+
+                    WITH interaction, messages
+                    CALL (interaction, messages) {
+                        UNWIND RANGE(0, SIZE(messages) - 1) AS idx
+                        WITH interaction, messages[idx] AS message, idx
+                        MATCH (memory:Memory)-[:MESSAGE_SOURCE]->(message)
+                        CREATE (interaction)<-[:MESSAGE_SOURCE {msg_position: idx}]-(memory)
+                    }
+
+                    FOREACH (message IN messages | DETACH DELETE message)
+                } IN TRANSACTIONS OF 1000 ROWS
+                """
+            )
+            await result.consume()
+            self.logger.info(
+                "MessageBlock nodes successfully moved into their Interaction node's message lists"
+            )
+        self.logger.info("Migration of graph schema completed")
@@ -107,8 +107,8 @@ class Neo4jMemory(BaseGraphDB):
                     OPTIONAL MATCH (memory)-[:CONTRARY_UPDATE*]->(contraryMemory:Memory) WHERE NOT (contraryMemory)-[:CONTRARY_UPDATE]->()
                     WITH coalesce(contraryMemory, memory) AS memoryToReturn
 
-                    OPTIONAL MATCH (memoryToReturn)-[:MESSAGE_SOURCE]->(msgSource)
-                    WITH memoryToReturn, collect(msgSource{.*}) as msgSources
+                    OPTIONAL MATCH (memoryToReturn)-[src:MESSAGE_SOURCE]->(srcInteraction)
+                    WITH memoryToReturn, collect(src{.msg_position, role: srcInteraction.message_roles[src.msg_position], content: srcInteraction.message_contents[src.msg_position]}) as msgSources
                                   
                     MATCH (user:User {org_id: memoryToReturn.org_id, user_id: memoryToReturn.user_id})              
                     MATCH (agent:Agent {org_id: memoryToReturn.org_id, agent_id: memoryToReturn.agent_id})
@@ -209,8 +209,8 @@ class Neo4jMemory(BaseGraphDB):
                 """
                 MATCH (m:Memory {org_id: $org_id, user_id: $user_id, memory_id: $memory_id})
 
-                MATCH (m)-[:MESSAGE_SOURCE]->(msgSource)
-                WITH m, collect(msgSource{.*}) as msgSources
+                MATCH (m)-[src:MESSAGE_SOURCE]->(srcInteraction)
+                WITH m, collect(src{.msg_position, role: srcInteraction.message_roles[src.msg_position], content: srcInteraction.message_contents[src.msg_position]}) as msgSources
 
                 MATCH (user:User {org_id: m.org_id, user_id: m.user_id})              
                 MATCH (agent:Agent {org_id: m.org_id, agent_id: m.agent_id})
@@ -311,8 +311,8 @@ class Neo4jMemory(BaseGraphDB):
                 WITH nodes(path) AS memory_history
                 UNWIND memory_history AS memory
 
-                OPTIONAL MATCH (memory)-[:MESSAGE_SOURCE]->(msgSource)
-                WITH memory, collect(msgSource{.*}) as msgSources
+                OPTIONAL MATCH (memory)-[src:MESSAGE_SOURCE]->(srcInteraction)
+                WITH memory, collect(src{.msg_position, role: srcInteraction.message_roles[src.msg_position], content: srcInteraction.message_contents[src.msg_position]}) as msgSources
 
                 MATCH (user:User {org_id: memory.org_id, user_id: memory.user_id})              
                 MATCH (agent:Agent {org_id: memory.org_id, agent_id: memory.agent_id})
@@ -424,8 +424,8 @@ class Neo4jMemory(BaseGraphDB):
 
                 WITH memory AS m SKIP $skip LIMIT $limit
 
-                OPTIONAL MATCH (m)-[:MESSAGE_SOURCE]->(msgSource)
-                WITH m, collect(msgSource{{.*}}) as msgSources
+                OPTIONAL MATCH (m)-[src:MESSAGE_SOURCE]->(srcInteraction)
+                WITH m, collect(src{{.msg_position, role: srcInteraction.message_roles[src.msg_position], content: srcInteraction.message_contents[src.msg_position]}}) as msgSources
 
                 MATCH (user:User {{org_id: m.org_id, user_id: m.user_id}})
                 MATCH (agent:Agent {{org_id: m.org_id, agent_id: m.agent_id}})
@@ -0,0 +1,47 @@
+import logging
+from typing import Any, Awaitable, Callable, Set, TypeVar
+
+import neo4j
+import neo4j.exceptions
+
+T = TypeVar("T")
+
+PARALLEL_RUNTIME_HINT = "CYPHER runtime=parallel "
+
+# Status code of the error the server raises for a query it can't run on the chosen runtime.
+RUNTIME_UNSUPPORTED_CODE = "Neo.ClientError.Statement.RuntimeUnsupportedError"
+
+
+async def execute_read_in_parallel_runtime(
+    session: neo4j.AsyncSession,
+    read_tx: Callable[..., Awaitable[T]],
+    enabled: bool,
+    unsupported_reads: Set[str],
+    logger: logging.Logger,
+    *args: Any,
+) -> T:
+    """
+    Executes a read transaction function, with its query run on Neo4j's parallel runtime if enabled.
+
+    The transaction function receives the runtime hint to prefix its query with as its first argument
+    after `tx` (an empty string when the parallel runtime is not used), followed by `args`.
+
+    Note:
+        The parallel runtime is only available on Neo4j Enterprise Edition / Aura (5.13+), and not every
+        query is eligible for it. If the server rejects the query as unsupported by the runtime, it is executed
+        again on the default runtime, and the transaction function's name is added to `unsupported_reads` so
+        later calls skip the parallel attempt. Any other error is raised as is.
+    """
+
+    if enabled and read_tx.__qualname__ not in unsupported_reads:
+        try:
+            return await session.execute_read(read_tx, PARALLEL_RUNTIME_HINT, *args)
+        except neo4j.exceptions.ClientError as e:
+            if e.code != RUNTIME_UNSUPPORTED_CODE:
+                raise
+            unsupported_reads.add(read_tx.__qualname__)
+            logger.info(
+                f"Query not executable on the parallel runtime, using the default runtime for it from now on: {e.message}"
+            )
+
+    return await session.execute_read(read_tx, "", *args)
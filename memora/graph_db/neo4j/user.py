@@ -8,6 +8,55 @@ from typing_extensions import override
 from memora.schema import models
 
 from ..base import BaseGraphDB
+from .runtime import execute_read_in_parallel_runtime
+
+_Q_CREATE_USER = """
+    MATCH (o:Org {org_id: $org_id})
+    CREATE (u:User {
+        org_id: $org_id,
+        user_id: $user_id,
+        user_name: $user_name,
+        created_at: datetime()
+    })
+    CREATE (u)-[:BELONGS_TO]->(o)
+    CREATE (ic:InteractionCollection {
+        org_id: $org_id,
+        user_id: $user_id
+    })
+    CREATE (mc:MemoryCollection {
+        org_id: $org_id,
+        user_id: $user_id
+    })
+    CREATE (u)-[:INTERACTIONS_IN]->(ic)
+    CREATE (u)-[:HAS_MEMORIES]->(mc)
+    RETURN u{.org_id, .user_id, .user_name, .created_at} as user
+"""
+
+_Q_UPDATE_USER = """
+    MATCH (u:User {org_id: $org_id, user_id: $user_id})
+    SET u.user_name = $new_user_name
+    RETURN u{.org_id, .user_id, .user_name, .created_at} as user
+"""
+
+_Q_DELETE_USER = """
+    MATCH (u:User {org_id: $org_id, user_id: $user_id})
+    OPTIONAL MATCH (u)-[:INTERACTIONS_IN]->(interactioncollection)
+    OPTIONAL MATCH (interactioncollection)-[:HAD_INTERACTION]->(interaction)
+    OPTIONAL MATCH (u)-[:HAS_MEMORIES]->(memcollection)
+    OPTIONAL MATCH (memcollection)-[:INCLUDES]->(memory)
+    OPTIONAL MATCH (interaction)-[:HAS_OCCURRENCE_ON]->(date)
+    DETACH DELETE u, interactioncollection, interaction, memcollection, memory, date
+"""
+
+_Q_GET_USER = """
+    MATCH (u:User {org_id: $org_id, user_id: $user_id})
+    RETURN u{.org_id, .user_id, .user_name, .created_at} as user
+"""
+
+_Q_GET_ALL_ORG_USERS = """
+    MATCH (o:Org {org_id: $org_id})<-[:BELONGS_TO]-(u:User)
+    RETURN collect(u{.org_id, .user_id, .user_name, .created_at}) as users
+"""
 
 
 class Neo4jUser(BaseGraphDB):
@@ -40,27 +89,7 @@ class Neo4jUser(BaseGraphDB):
 
         async def create_user_tx(tx):
             result = await tx.run(
-                """
-                MATCH (o:Org {org_id: $org_id})
-                CREATE (u:User {
-                    org_id: $org_id,
-                    user_id: $user_id,
-                    user_name: $user_name,
-                    created_at: datetime()
-                })
-                CREATE (u)-[:BELONGS_TO]->(o)
-                CREATE (ic:InteractionCollection {
-                    org_id: $org_id,
-                    user_id: $user_id
-                })
-                CREATE (mc:MemoryCollection {
-                    org_id: $org_id,
-                    user_id: $user_id
-                })
-                CREATE (u)-[:INTERACTIONS_IN]->(ic)
-                CREATE (u)-[:HAS_MEMORIES]->(mc)
-                RETURN u{.org_id, .user_id, .user_name, .created_at} as user
-            """,
+                _Q_CREATE_USER,
                 org_id=org_id,
                 user_id=user_id,
                 user_name=user_name,
@@ -117,11 +146,7 @@ class Neo4jUser(BaseGraphDB):
 
         async def update_user_tx(tx):
             result = await tx.run(
-                """
-                MATCH (u:User {org_id: $org_id, user_id: $user_id})
-                SET u.user_name = $new_user_name
-                RETURN u{.org_id, .user_id, .user_name, .created_at} as user
-            """,
+                _Q_UPDATE_USER,
                 org_id=org_id,
                 user_id=user_id,
                 new_user_name=new_user_name,
@@ -166,20 +191,12 @@ class Neo4jUser(BaseGraphDB):
         self.logger.info(f"Deleting user {user_id}")
 
         async def delete_user_tx(tx):
-            await tx.run(
-                """
-                MATCH (u:User {org_id: $org_id, user_id: $user_id})
-                OPTIONAL MATCH (u)-[:INTERACTIONS_IN]->(interactioncollection)
-                OPTIONAL MATCH (interactioncollection)-[:HAD_INTERACTION]->(interaction)
-                OPTIONAL MATCH (interaction)-[:FIRST_MESSAGE|IS_NEXT*]->(message)
-                OPTIONAL MATCH (u)-[:HAS_MEMORIES]->(memcollection)
-                OPTIONAL MATCH (memcollection)-[:INCLUDES]->(memory)
-                OPTIONAL MATCH (interaction)-[:HAS_OCCURRENCE_ON]->(date)
-                DETACH DELETE u, interactioncollection, interaction, message, memcollection, memory, date
-            """,
+            result = await tx.run(
+                _Q_DELETE_USER,
                 org_id=org_id,
                 user_id=user_id,
             )
+            await result.consume()
 
         async with self.driver.session(
             database=self.database, default_access_mode=neo4j.WRITE_ACCESS
@@ -209,10 +226,7 @@ class Neo4jUser(BaseGraphDB):
 
         async def get_user_tx(tx):
             result = await tx.run(
-                """
-                MATCH (u:User {org_id: $org_id, user_id: $user_id})
-                RETURN u{.org_id, .user_id, .user_name, .created_at} as user
-            """,
+                _Q_GET_USER,
                 org_id=org_id,
                 user_id=user_id,
             )
@@ -259,22 +273,26 @@ class Neo4jUser(BaseGraphDB):
 
         self.logger.info(f"Getting all users for organization {org_id}")
 
-        async def get_users_tx(tx):
+        async def get_users_tx(tx, runtime_hint: str):
             result = await tx.run(
-                """
-                MATCH (o:Org {org_id: $org_id})<-[:BELONGS_TO]-(u:User)
-                RETURN u{.org_id, .user_id, .user_name, .created_at} as user
-            """,
+                runtime_hint + _Q_GET_ALL_ORG_USERS,
                 org_id=org_id,
             )
-            records = await result.value("user", [])
-            return records
+            # All users come back projected in a single record.
+            record = await result.single()
+            return record["users"]
 
         async with self.driver.session(
             database=self.database, default_access_mode=neo4j.READ_ACCESS
         ) as session:
 
-            all_users_data = await session.execute_read(get_users_tx)
+            all_users_data = await execute_read_in_parallel_runtime(
+                session,
+                get_users_tx,
+                self.parallel_runtime_reads,
+                self.parallel_runtime_unsupported_reads,
+                self.logger,
+            )
 
             return [
                 models.User(